@@ -46,6 +46,7 @@ module [1]_ shipped with CircuitPython.
 
 # stdlib
 import ipaddress
+import random
 import rtc  # type: ignore[import]  # nodep (CircuitPython builtin)
 import socketpool  # type: ignore[import]  # nodep (CircuitPython builtin)
 import ssl
@@ -61,7 +62,7 @@ if False:  # TYPE_CHECKING
 	# stdlib
 	import wifi  # type: ignore[import]
 	from types import TracebackType
-	from typing import Any, Dict, NoReturn, Optional, Tuple, Type, Union
+	from typing import Any, Callable, Dict, List, NoReturn, Optional, Tuple, Type, Union
 
 __author__: str = "Dominic Davis-Foster"
 __copyright__: str = "2021 Dominic Davis-Foster"
@@ -72,7 +73,81 @@ __email__: str = "dominic@davis-foster.co.uk"
 __all__ = ["WiFiManager"]
 
 # reference time for NTP (in seconds since 1900-01-01 00:00:00)
-TIME1970 = 2208988800  # 1970-01-01 00:00:00
+TIME1970 = const(2208988800)  # 1970-01-01 00:00:00
+
+_NTP_PORT = const(123)
+
+# NTP servers to try, in order
+_NTP_SERVERS = ("pool.ntp.org", "time.google.com", "time.cloudflare.com")
+
+# NTP request packet (LI = 0, VN = 3, Mode = 3 (client))
+_NTP_REQUEST = b'\x1b' + 47 * b'\0'
+
+# Default headers for HTTP requests. Shared between requests, as adafruit_requests doesn't modify them.
+_KEEP_ALIVE_HEADERS = {"Connection": "keep-alive"}
+
+# Status pixel colours
+_PIX_OFF = const(0)
+_PIX_CONNECTING = (100, 0, 0)
+_PIX_OK = (0, 100, 0)
+_PIX_BUSY = (0, 0, 100)
+
+# How long (in seconds) to cache DNS lookups for
+_DNS_TTL = const(300)
+
+# The maximum number of DNS lookups to cache
+_DNS_CACHE_SIZE = const(8)
+
+
+def _to_secret(value: "Union[str, None, Tuple[str, ...], List[str]]") -> "Any":
+	"""
+	Convert a password (or list of passwords) to :class:`bytearray`, so it can be overwritten later.
+
+	:param value:
+	"""
+
+	if value is None:
+		return None
+	if isinstance(value, (tuple, list)):
+		return [_to_secret(v) for v in value]
+	return bytearray(value.encode("utf-8"))
+
+
+def _zeroize(value: "Any") -> None:
+	"""
+	Overwrite a password (or list of passwords) created by :func:`_to_secret` with zeros.
+
+	:param value:
+	"""
+
+	if isinstance(value, list):
+		for v in value:
+			_zeroize(v)
+	elif value is not None:
+		for i in range(len(value)):
+			value[i] = 0
+
+
+class _BusyPixel:
+	"""
+	Context manager which shows the "busy" colour on the status pixel, and turns it off again on exit.
+
+	:param manager:
+	"""
+
+	def __init__(self, manager: "WiFiManager"):
+		self._manager = manager
+
+	def __enter__(self) -> None:
+		self._manager.pixel_status(_PIX_BUSY)
+
+	def __exit__(
+			self,
+			exception_type: "Optional[Type[BaseException]]",
+			exception_value: "Optional[BaseException]",
+			traceback: "Optional[TracebackType]",
+			) -> None:
+		self._manager.pixel_status(_PIX_OFF)
 
 
 class WiFiManager:
@@ -90,6 +165,8 @@ class WiFiManager:
 			status_pixel: Optional[Any] = None,
 			connection_type: int = NORMAL,
 			debug: bool = False,
+			debug_scan: bool = False,
+			attempts: "Optional[int]" = 5,
 			):
 		"""
 		:param radio: The Wi-Fi radio object we are using (typically ``wifi.radio``).
@@ -97,20 +174,53 @@ class WiFiManager:
 		:param status_pixel: (Optional) The pixel device - A NeoPixel, DotStar, or RGB LED.
 		:type status_pixel: NeoPixel, DotStar, or RGB LED
 		:param debug:
+		:param debug_scan: Whether to scan for and list nearby access points before connecting.
+			Only has an effect when ``debug`` is :py:obj:`True`.
+			Scanning blocks for several seconds, so it is disabled by default.
+		:param attempts: The number of failed connection attempts after which to give up
+			and raise a :exc:`ConnectionError`. If :py:obj:`None` keep retrying indefinitely,
+			except that with a single access point a :exc:`ConnectionError` from the radio
+			(e.g. for a wrong password) is raised immediately.
 		"""
 
 		# Read the settings
 		self.radio = radio
 		self.debug = debug
+		self.debug_scan = debug_scan
+		self.attempts = attempts
 		self.ssid = secrets["ssid"]
-		self.password = secrets.get("password", None)
+		# Passwords are stored as bytearrays so they can be scrubbed from memory by deinit.
+		self.password = _to_secret(secrets.get("password", None))
 		self._connection_type = connection_type
 		self.statuspix = status_pixel
-		self.pixel_status(0)
+		self._set_pixel = self._get_pixel_setter(status_pixel)
+		self._last_pix: "Union[None, int, Tuple[int, int, int]]" = None
+		self._busy_pixel = _BusyPixel(self)
+		self.pixel_status(_PIX_OFF)
 		self._ap_index = 0
+		self._access_points = self._get_access_points(self.ssid, self.password)
 		self._pool: "Optional[socketpool.SocketPool]" = None
 		self._requests: "Optional[requests.Session]" = None
 
+		# Whether we believe the radio is connected. Cleared on deinit and when a request fails.
+		self._connected = False
+
+		# Set by deinit once the passwords have been overwritten; the manager can't connect after that.
+		self._deinitialised = False
+
+		# Buffer for NTP responses, which are always 48 bytes.
+		self._ntp_buf = bytearray(48)
+
+		# The UDP socket used for NTP.
+		# This is created lazily by get_ntp_time and is tied to the current socket pool.
+		self._ntp_socket: "Optional[socketpool.Socket]" = None
+
+		# Maps (host, port) to the time of the lookup and the result of getaddrinfo.
+		self._dns_cache: "Dict[Tuple[str, int], Tuple[float, Any]]" = {}
+
+		# The SSID, BSSID and channel of the last access point we connected to.
+		self._last_ap: "Optional[Tuple[str, bytes, int]]" = None
+
 		# Check for WPA2 Enterprise keys in the secrets dictionary and load them if they exist
 		if secrets.get("ent_ssid"):
 			self.ent_ssid = secrets["ent_ssid"]
@@ -123,7 +233,20 @@ class WiFiManager:
 		if secrets.get("ent_user"):
 			self.ent_user = secrets["ent_user"]
 		if secrets.get("ent_password"):
-			self.ent_password = secrets["ent_password"]
+			self.ent_password = _to_secret(secrets["ent_password"])
+
+		# Encode these once here rather than on every connection attempt.
+		self._ssid_b = self.ssid.encode("utf-8") if isinstance(self.ssid, str) else None
+		self._ent_ssid_b: "Optional[bytes]" = None
+		self._ent_ident_b: "Optional[bytes]" = None
+		self._ent_user_b: "Optional[bytes]" = None
+
+		if connection_type == self.ENTERPRISE:
+			if isinstance(self.ent_ssid, str):
+				self._ent_ssid_b = self.ent_ssid.encode("utf-8")
+			self._ent_ident_b = self.ent_ident.encode("utf-8")
+			if hasattr(self, "ent_user"):
+				self._ent_user_b = self.ent_user.encode("utf-8")
 
 	# pylint: enable=too-many-arguments
 
@@ -133,16 +256,26 @@ class WiFiManager:
 	def connect(self) -> None:
 		"""
 		Attempt to connect to WiFi using the current settings.
+
+		:raises RuntimeError: If :meth:`~.deinit` has been called.
 		"""
 
+		if self._deinitialised:
+			raise RuntimeError("The WiFiManager has been deinitialised; create a new one to reconnect.")
+
 		if self.debug:
 			print("MAC addr:", [hex(i) for i in self.radio.mac_address])
 
+		if self.debug and self.debug_scan:
 			for access_pt in self.radio.start_scanning_networks():
 				print("\t%s\t\tRSSI: %d" % (str(access_pt.ssid, "utf-8"), access_pt.rssi))
 
 			self.radio.stop_scanning_networks()
 
+		# If a request failed but the radio is still associated, the existing
+		# socket pool and session are still usable and can be kept.
+		was_associated = self.radio.ap_info is not None
+
 		if self._connection_type == self.NORMAL:
 			self.connect_normal()
 		elif self._connection_type == self.ENTERPRISE:
@@ -150,50 +283,167 @@ class WiFiManager:
 		else:
 			raise TypeError("Invalid WiFi connection type specified")
 
-		self._pool = socketpool.SocketPool(self.radio)
-		self._requests = requests.Session(self._pool, ssl.create_default_context())
+		if self._pool is None or self._requests is None or not was_associated:
+			self._close_ntp_socket()
+			self._dns_cache.clear()
+			self._pool = socketpool.SocketPool(self.radio)
+			self._requests = requests.Session(self._pool, ssl.create_default_context())
+
+		self._connected = True
+
+	def _close_ntp_socket(self) -> None:
+		"""
+		Close the NTP socket, if open.
+		"""
+
+		if self._ntp_socket is not None:
+			self._ntp_socket.close()
+			self._ntp_socket = None
+
+	def _resolve(self, host: str, port: int) -> "Any":
+		"""
+		Resolve the given host and port with ``getaddrinfo``, caching the result for a few minutes.
+
+		At most a handful of lookups are cached; the oldest is discarded to make room for new ones.
+
+		:param host:
+		:param port:
+		"""
+
+		if self._pool is None:
+			raise RuntimeError("Not connected to Wi-Fi")
+
+		key = (host, port)
+		cached = self._dns_cache.get(key)
+		now = time.monotonic()
 
-	def _get_next_ap(self) -> "Tuple[str, Optional[str]]":
-		if isinstance(self.ssid, (tuple, list)) and isinstance(self.password, (tuple, list)):
-			if not self.ssid or not self.password:
+		if cached is not None and now - cached[0] < _DNS_TTL:
+			return cached[1]
+
+		addrinfo = self._pool.getaddrinfo(host, port)
+
+		if key not in self._dns_cache and len(self._dns_cache) >= _DNS_CACHE_SIZE:
+			# Drop expired entries, and if the cache is still full the oldest one.
+			for k in [k for k, v in self._dns_cache.items() if now - v[0] >= _DNS_TTL]:
+				del self._dns_cache[k]
+			if len(self._dns_cache) >= _DNS_CACHE_SIZE:
+				del self._dns_cache[min(self._dns_cache, key=lambda k: self._dns_cache[k][0])]
+
+		self._dns_cache[key] = (now, addrinfo)
+		return addrinfo
+
+	def _ensure_connected(self) -> None:
+		"""
+		Connect to Wi-Fi if we aren't already connected.
+		"""
+
+		if not self._connected:
+			self.connect()
+
+	@staticmethod
+	def _get_access_points(
+			ssid: "Union[str, Tuple[str, ...], List[str]]",
+			password: "Union[bytearray, None, List[bytearray]]",
+			) -> "Tuple[Tuple[str, Optional[bytearray]], ...]":
+		"""
+		Returns a tuple of ``(ssid, password)`` pairs for the access points to try, in order.
+
+		:param ssid: The SSID, or a list of SSIDs.
+		:param password: The password, or a list of passwords.
+		"""
+
+		if isinstance(ssid, (tuple, list)) and isinstance(password, (tuple, list)):
+			if not ssid or not password:
 				raise ValueError("SSID and Password should contain at least 1 value")
-			if len(self.ssid) != len(self.password):
+			if len(ssid) != len(password):
 				raise ValueError("The length of SSIDs and Passwords should match")
-			access_point = (self.ssid[self._ap_index], self.password[self._ap_index])
-			self._ap_index += 1
-			if self._ap_index >= len(self.ssid):
-				self._ap_index = 0
-			return access_point
-		if isinstance(self.ssid, (tuple, list)) or isinstance(self.password, (tuple, list)):
+			return tuple(zip(ssid, password))
+		if isinstance(ssid, (tuple, list)) or isinstance(password, (tuple, list)):
 			raise NotImplementedError(
 					"If using multiple passwords, both SSID and Password should be lists or tuples"
 					)
-		return self.ssid, self.password
+		return ((ssid, password), )
+
+	def _get_next_ap(self) -> "Tuple[str, Optional[bytearray]]":
+		access_point = self._access_points[self._ap_index]
+		self._ap_index += 1
+		if self._ap_index >= len(self._access_points):
+			self._ap_index = 0
+		return access_point
+
+	def _find_ap(self, ssid: str) -> "Optional[Tuple[str, Optional[bytearray]]]":
+		"""
+		Returns the configured ``(ssid, password)`` pair for the given SSID, or :py:obj:`None` if there isn't one.
+
+		:param ssid:
+		"""
+
+		for access_point in self._access_points:
+			if access_point[0] == ssid:
+				return access_point
+
+		return None
 
 	def connect_normal(self) -> None:
 		"""
 		Attempt a regular style Wi-Fi connection.
 		"""
 
+		radio = self.radio
+		ap_info = radio.ap_info
 		failure_count = 0
-		(ssid, password) = self._get_next_ap()
-		while not self.radio.ap_info:
+
+		# Try the access point we last connected to first, directly by its BSSID and channel.
+		last_ap = self._last_ap
+		retry_ap = None
+		if last_ap is not None:
+			retry_ap = self._find_ap(last_ap[0])
+			if retry_ap is None:
+				last_ap = None
+
+		while ap_info is None:
+			if retry_ap is not None:
+				(ssid, password) = retry_ap
+				retry_ap = None
+			else:
+				(ssid, password) = self._get_next_ap()
+
 			try:
 				if self.debug:
 					print("Connecting to AP...")
-				self.pixel_status((100, 0, 0))
-				self.radio.connect(ssid, password)
+				self.pixel_status(_PIX_CONNECTING)
+				if last_ap is not None:
+					# Skip the full scan and go straight to the known access point.
+					radio.connect(ssid, password, bssid=last_ap[1], channel=last_ap[2])
+				else:
+					radio.connect(ssid, password)
 				failure_count = 0
-				self.pixel_status((0, 100, 0))
-			except (ValueError, RuntimeError) as error:
+				self.pixel_status(_PIX_OK)
+				ap_info = radio.ap_info
+			except (ValueError, RuntimeError, ConnectionError) as error:
+				if last_ap is not None:
+					# The access point may have moved channel.
+					# Retry the same SSID with a full scan straight away.
+					if self.debug:
+						print("Failed to connect to the previous access point, scanning\n", error)
+					self._last_ap = last_ap = None
+					retry_ap = (ssid, password)
+					continue
+
+				# Without a retry limit and with nothing to fail over to,
+				# let the caller see errors such as a wrong password.
+				if isinstance(error, ConnectionError) and self.attempts is None and len(self._access_points) == 1:
+					raise
+
 				print("Failed to connect, retrying\n", error)
 				failure_count += 1
-				# TODO: need to be able to reset somehow.
-				# if failure_count >= self.attempts:
-				# 	failure_count = 0
-				# 	(ssid, password) = self._get_next_ap()
-				# 	# self.reset()
-				continue
+				if self.attempts is not None and failure_count >= self.attempts:
+					raise ConnectionError(f"Failed to connect after {failure_count} attempts") from error
+
+				# Exponential backoff (capped at 16 seconds) with a little jitter
+				sleep(0.25 * (1 << min(failure_count, 6)) + random.random() * 0.1)
+
+		self._last_ap = (ap_info.ssid, ap_info.bssid, ap_info.channel)
 
 	def create_ap(self) -> None:
 		"""
@@ -210,17 +460,17 @@ class WiFiManager:
 			try:
 				if self.debug:
 					print("Waiting for AP to be initialized...")
-				self.pixel_status((100, 0, 0))
+				self.pixel_status(_PIX_CONNECTING)
 				if self.password:
-					self.esp.create_AP(bytes(self.ssid, "utf-8"), bytes(self.password, "utf-8"))
+					self.esp.create_AP(self._ssid_b, self.password)
 				else:
-					self.esp.create_AP(bytes(self.ssid, "utf-8"), None)
+					self.esp.create_AP(self._ssid_b, None)
 				failure_count = 0
-				self.pixel_status((0, 100, 0))
+				self.pixel_status(_PIX_OK)
 			except (ValueError, RuntimeError) as error:
 				print("Failed to create access point\n", error)
 				failure_count += 1
-				if failure_count >= self.attempts:
+				if self.attempts is not None and failure_count >= self.attempts:
 					failure_count = 0
 					self.reset()
 				continue
@@ -234,28 +484,58 @@ class WiFiManager:
 		raise NotImplementedError
 
 		failure_count = 0
-		self.esp.wifi_set_network(bytes(self.ent_ssid, "utf-8"))
-		self.esp.wifi_set_entidentity(bytes(self.ent_ident, "utf-8"))
-		self.esp.wifi_set_entusername(bytes(self.ent_user, "utf-8"))
-		self.esp.wifi_set_entpassword(bytes(self.ent_password, "utf-8"))
+		self.esp.wifi_set_network(self._ent_ssid_b)
+		self.esp.wifi_set_entidentity(self._ent_ident_b)
+		self.esp.wifi_set_entusername(self._ent_user_b)
+		self.esp.wifi_set_entpassword(self.ent_password)
 		self.esp.wifi_set_entenable()
 		while not self.radio.ap_info:
 			try:
 				if self.debug:
 					print("Waiting for the ESP32 to connect to the WPA2 Enterprise AP...")
-				self.pixel_status((100, 0, 0))
+				self.pixel_status(_PIX_CONNECTING)
 				sleep(1)
 				failure_count = 0
-				self.pixel_status((0, 100, 0))
+				self.pixel_status(_PIX_OK)
 				sleep(1)
 			except (ValueError, RuntimeError) as error:
 				print("Failed to connect, retrying\n", error)
 				failure_count += 1
-				if failure_count >= self.attempts:
+				if self.attempts is not None and failure_count >= self.attempts:
 					failure_count = 0
 					self.reset()
 				continue
 
+	def _request(self, method: str, url: str, **kw) -> requests.Response:
+		"""
+		Pass the request to requests and update status LED.
+
+		:param method: The HTTP method to use, e.g. ``"GET"``.
+		:param url: The URL of the request.
+		:param kw: Additional keyword arguments for :meth:`adafruit_requests.Session.request`.
+
+		:return: The response from the request.
+		"""
+
+		self._ensure_connected()
+
+		if self._requests is None:
+			raise RuntimeError("Not connected to Wi-Fi")
+
+		# Ask the server to keep the connection open, so the session can reuse
+		# the socket (and TLS session) for later requests to the same host.
+		# Headers supplied by the caller are passed through untouched rather than copied;
+		# HTTP/1.1 connections are persistent unless they say otherwise.
+		if kw.get("headers") is None:
+			kw["headers"] = _KEEP_ALIVE_HEADERS
+
+		with self._busy_pixel:
+			try:
+				return self._requests.request(method, url, **kw)
+			except (OSError, RuntimeError):
+				self._connected = False
+				raise
+
 	def get(self, url: str, **kw) -> requests.Response:
 		"""
 		Pass the Get request to requests and update status LED.
@@ -269,15 +549,7 @@ class WiFiManager:
 		:return: The response from the request.
 		"""
 
-		if not self.radio.ap_info:
-			self.connect()
-
-		assert self._requests is not None
-
-		self.pixel_status((0, 0, 100))
-		return_val = self._requests.get(url, **kw)
-		self.pixel_status(0)
-		return return_val
+		return self._request("GET", url, **kw)
 
 	def post(self, url: str, **kw) -> requests.Response:
 		"""
@@ -292,14 +564,7 @@ class WiFiManager:
 		:return: The response from the request.
 		"""
 
-		if not self.radio.ap_info:
-			self.connect()
-
-		assert self._requests is not None
-
-		self.pixel_status((0, 0, 100))
-		return_val = self._requests.post(url, **kw)
-		return return_val
+		return self._request("POST", url, **kw)
 
 	def put(self, url: str, **kw) -> requests.Response:
 		"""
@@ -314,15 +579,7 @@ class WiFiManager:
 		:return: The response from the request.
 		"""
 
-		if not self.radio.ap_info:
-			self.connect()
-
-		assert self._requests is not None
-
-		self.pixel_status((0, 0, 100))
-		return_val = self._requests.put(url, **kw)
-		self.pixel_status(0)
-		return return_val
+		return self._request("PUT", url, **kw)
 
 	def patch(self, url: str, **kw) -> requests.Response:
 		"""
@@ -337,15 +594,7 @@ class WiFiManager:
 		:return: The response from the request.
 		"""
 
-		if not self.radio.ap_info:
-			self.connect()
-
-		assert self._requests is not None
-
-		self.pixel_status((0, 0, 100))
-		return_val = self._requests.patch(url, **kw)
-		self.pixel_status(0)
-		return return_val
+		return self._request("PATCH", url, **kw)
 
 	def delete(self, url: str, **kw) -> requests.Response:
 		"""
@@ -360,17 +609,15 @@ class WiFiManager:
 		:return: The response from the request.
 		"""
 
-		if not self.radio.ap_info:
-			self.connect()
-
-		assert self._requests is not None
+		return self._request("DELETE", url, **kw)
 
-		self.pixel_status((0, 0, 100))
-		return_val = self._requests.delete(url, **kw)
-		self.pixel_status(0)
-		return return_val
-
-	def ping(self, host: str, *, timeout: "Optional[float]" = 0.5) -> float:
+	def ping(
+			self,
+			host: str,
+			*,
+			timeout: "Optional[float]" = 0.5,
+			_ip_address: "Callable[[str], Any]" = ipaddress.ip_address,  # avoids global lookups on MicroPython
+			) -> float:
 		"""
 		Pass the Ping request to the ESP32, update status LED, return response time.
 
@@ -380,28 +627,54 @@ class WiFiManager:
 		:returns: The echo time in seconds, or :py:obj:`None` when it times out.
 		"""
 
-		if not self.radio.ap_info:
-			self.connect()
+		self._ensure_connected()
 
-		assert self._pool is not None
+		if self._pool is None:
+			raise RuntimeError("Not connected to Wi-Fi")
 
-		self.pixel_status((0, 0, 100))
-		addrinfo = self._pool.getaddrinfo(host, 80)
-		ip = ipaddress.ip_address(addrinfo[0][4][0])
-		response_time = self.radio.ping(ip, timeout=timeout)
-		self.pixel_status(0)
-		return response_time
+		with self._busy_pixel:
+			try:
+				addrinfo = self._resolve(host, 80)
+				ip = _ip_address(addrinfo[0][4][0])
+				return self.radio.ping(ip, timeout=timeout)
+			except (OSError, RuntimeError):
+				self._connected = False
+				self._dns_cache.pop((host, 80), None)
+				raise
 
 	def ip_address(self) -> str:
 		"""
 		Returns a formatted local IP address, update status pixel.
 		"""
 
-		if not self.radio.ap_info:
-			self.connect()
-		self.pixel_status((0, 0, 100))
-		self.pixel_status(0)
-		return str(self.radio.ipv4_address)
+		self._ensure_connected()
+		with self._busy_pixel:
+			return str(self.radio.ipv4_address)
+
+	@staticmethod
+	def _get_pixel_setter(status_pixel: "Optional[Any]") -> "Callable[[Union[int, Tuple[int, int, int]]], None]":
+		"""
+		Returns a function which sets the colour of the given status pixel.
+
+		:param status_pixel: The pixel device - A NeoPixel, DotStar, or RGB LED.
+		"""
+
+		if status_pixel is None:
+
+			def set_pixel(value: "Union[int, Tuple[int, int, int]]") -> None:
+				pass
+
+		elif hasattr(status_pixel, "color"):
+			# Bind to a non-Optional name, as narrowing doesn't carry into the nested function.
+			pixel: "Any" = status_pixel
+
+			def set_pixel(value: "Union[int, Tuple[int, int, int]]") -> None:
+				pixel.color = value
+
+		else:
+			set_pixel = status_pixel.fill
+
+		return set_pixel
 
 	def pixel_status(self, value: "Union[int, Tuple[int, int, int]]") -> None:
 		"""
@@ -410,30 +683,51 @@ class WiFiManager:
 		:param value: The value to set the Board's status LED to.
 		"""
 
-		if self.statuspix:
-			if hasattr(self.statuspix, "color"):
-				self.statuspix.color = value
-			else:
-				self.statuspix.fill(value)
+		# Avoid a bus transaction if the pixel is already showing this colour.
+		if value == self._last_pix:
+			return
+
+		self._set_pixel(value)
+		self._last_pix = value
 
 	def signal_strength(self) -> int:
 		"""
 		Returns receiving signal strength indicator in dBm.
 		"""
 
-		if not self.radio.ap_info:
+		ap_info = self.radio.ap_info
+		if ap_info is None:
 			self.connect()
-		return self.radio.ap_info.rssi
+			ap_info = self.radio.ap_info
+		return ap_info.rssi
 
 	def deinit(self) -> None:
 		"""
-		Blank out the NeoPixels and release the socket pool.
+		Blank out the NeoPixels, release the socket pool, and overwrite the stored passwords.
+
+		The passwords cannot be recovered afterwards, so any further attempt to connect
+		raises a :exc:`RuntimeError`. To use Wi-Fi again, create a new :class:`~.WiFiManager`.
 		"""
 
-		self.pixel_status(0)
+		self.pixel_status(_PIX_OFF)
+
+		self._connected = False
+		self._close_ntp_socket()
+		self._dns_cache.clear()
+
+		# Drop the session so its SSL context and buffers can be garbage collected.
+		self._requests = None
 
 		if self._pool is not None:
-			self._pool.close()()
+			self._pool.close()
+			self._pool = None
+
+		_zeroize(self.password)
+		_zeroize(getattr(self, "ent_password", None))
+		self.password = None
+		self.ent_password = None
+		self._access_points = ()
+		self._deinitialised = True
 
 	def __enter__(self) -> "WiFiManager":
 		return self
@@ -446,29 +740,68 @@ class WiFiManager:
 			) -> None:
 		self.deinit()
 
-	def get_ntp_time(self, tz_offset: int = 0, *, debug: bool = False) -> None:
+	def get_ntp_time(
+			self,
+			tz_offset: int = 0,
+			*,
+			debug: bool = False,
+			# bound here to avoid global lookups on MicroPython
+			_unpack_from: "Callable[..., Tuple[Any, ...]]" = struct.unpack_from,
+			_localtime: "Callable[[int], Any]" = time.localtime,
+			_RTC: "Callable[[], Any]" = rtc.RTC,
+			) -> bool:
 		"""
 		Obtain the current time over NTP and set the internal RTC.
+
+		Each NTP server is given a couple of seconds to respond,
+		and up to four attempts are made in total.
+
+		:param tz_offset: The offset from UTC, in seconds.
+		:param debug: Whether to print the time once it has been set.
+
+		:returns: Whether the time was obtained and the RTC set.
 		"""
 
-		msg = b'\x1b' + 47 * b'\0'
+		self._ensure_connected()
 
-		if not self.radio.ap_info:
-			self.connect()
+		if self._pool is None:
+			raise RuntimeError("Not connected to Wi-Fi")
+
+		for attempt in range(4):
+			server = _NTP_SERVERS[attempt % len(_NTP_SERVERS)]
+
+			try:
+				if self._ntp_socket is None:
+					self._ntp_socket = self._pool.socket(self._pool.AF_INET, self._pool.SOCK_DGRAM)
+					self._ntp_socket.settimeout(2)
+
+				self._ntp_socket.sendto(_NTP_REQUEST, self._resolve(server, _NTP_PORT)[0][4])
+				size, _ = self._ntp_socket.recvfrom_into(self._ntp_buf)
 
-		assert self._pool is not None
+				# The buffer is reused between calls, so a short reply would leave a stale timestamp in it.
+				if size >= 48:
+					break
 
-		client = self._pool.socket(self._pool.AF_INET, self._pool.SOCK_DGRAM)
-		client.settimeout(30)
-		with client:
-			client.sendto(msg, ("pool.ntp.org", 123))
-			buffer = bytearray(1024)
-			size, _ = client.recvfrom_into(buffer)
+			except OSError:
+				self._close_ntp_socket()
+				self._dns_cache.pop((server, _NTP_PORT), None)
 
-		t = struct.unpack("!12I", buffer[:size])[10]
+			# Back off (with a little jitter) before trying the next server
+			if attempt < 3:
+				sleep(0.25 * (1 << attempt) + random.random() * 0.1)
+
+		else:
+			if debug:
+				print("Unable to obtain the time over NTP")
+			return False
+
+		# Only the integer part of the transmit timestamp (bytes 40-43) is needed.
+		t = _unpack_from("!I", self._ntp_buf, 40)[0]
 		t -= TIME1970
 
-		now = time.localtime(t + tz_offset)
-		rtc.RTC().datetime = now
+		now = _localtime(t + tz_offset)
+		_RTC().datetime = now
 		if debug:
 			print("Time set to", now)
+
+		return True